@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: LGPL-3.0-only
 
 import logging
-from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 from transformers import PretrainedConfig
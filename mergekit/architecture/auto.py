@@ -157,16 +157,17 @@ def infer_architecture_info(
             f"  {repr(prefix or 'default')} with {module_layer_counts[prefix]} layers, {len(module_templates[prefix])} templates, and {len(module_loose_weights[prefix])} loose weights"
         )
 
+    tied_patterns = [re.compile(pat) for pat in tied_keys or []]
+
     def _wi(template: str, prefix: str) -> WeightInfo:
         full_name = prefix + template
-        optional = (full_name.replace("${layer_index}", "0") not in in_all_models) or (
-            tied_keys is not None
-            and any(re.search(pat, full_name) for pat in tied_keys)
-        )
-        is_embed = (full_name in embed_names) or any(
-            re.search(pat, full_name) for pat in tied_keys
-        )  # strictly speaking you can have tied non-embedding/lm-head weights
+        is_tied = any(p.search(full_name) for p in tied_patterns)
+        optional = (
+            full_name.replace("${layer_index}", "0") not in in_all_models
+        ) or is_tied
+        # strictly speaking you can have tied non-embedding/lm-head weights
         # but i've never seen it so let's not worry about it until this breaks something
+        is_embed = (full_name in embed_names) or is_tied
         return WeightInfo(
             name=template,
             optional=optional,
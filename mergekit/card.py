@@ -7,7 +7,6 @@ from typing import Generator, List, Optional
 import huggingface_hub
 import yaml
 from huggingface_hub.utils import HFValidationError
-from yaml.nodes import SequenceNode as SequenceNode
 
 from mergekit import merge_methods
 from mergekit.config import MergeConfiguration, ModelReference
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: LGPL-3.0-only
 
 import binascii
+import functools
 import logging
 import os
 import os.path
@@ -21,7 +22,6 @@ from typing import (
 
 import huggingface_hub
 import immutables
-import peft
 import torch
 import transformers
 from pydantic import BaseModel, model_serializer, model_validator
@@ -116,6 +116,9 @@ class ModelReference(BaseModel, frozen=True):
         )
 
         if not os.path.exists(out_path):
+            # peft is slow to import and only needed when merging adapters
+            import peft
+
             os.makedirs(out_path, exist_ok=True)
 
             config = self.config(trust_remote_code)
@@ -159,23 +162,8 @@ class ModelReference(BaseModel, frozen=True):
 
         path = self.model.path
         if not os.path.exists(path):
-            has_safetensors = any(
-                fn.lower().endswith(".safetensors")
-                for fn in huggingface_hub.list_repo_files(
-                    path, repo_type="model", revision=self.model.revision
-                )
-            )
-            patterns = ["tokenizer.model", "*.json"]
-            if has_safetensors:
-                patterns.append("*.safetensors")
-            else:
-                patterns.append("*.bin")
-
-            path = huggingface_hub.snapshot_download(
-                path,
-                revision=self.model.revision,
-                cache_dir=cache_dir,
-                allow_patterns=patterns,
+            path = _download_model_snapshot(
+                path, revision=self.model.revision, cache_dir=cache_dir
             )
         return path
 
@@ -225,6 +213,35 @@ class ModelReference(BaseModel, frozen=True):
         return str(self.model)
 
 
+@functools.lru_cache(maxsize=None)
+def _download_model_snapshot(
+    repo_id: str, revision: Optional[str], cache_dir: Optional[str]
+) -> str:
+    """Download the files needed to load a model from the Hugging Face Hub.
+
+    Results are cached for the lifetime of the process so repeated lookups
+    of the same model (for example from per-thread loader caches) do not
+    each make their own round trips to the Hub."""
+    has_safetensors = any(
+        fn.lower().endswith(".safetensors")
+        for fn in huggingface_hub.list_repo_files(
+            repo_id, repo_type="model", revision=revision
+        )
+    )
+    patterns = ["tokenizer.model", "*.json"]
+    if has_safetensors:
+        patterns.append("*.safetensors")
+    else:
+        patterns.append("*.bin")
+
+    return huggingface_hub.snapshot_download(
+        repo_id,
+        revision=revision,
+        cache_dir=cache_dir,
+        allow_patterns=patterns,
+    )
+
+
 def dtype_from_name(name: Optional[str]) -> Optional[torch.dtype]:
     if not name:
         return None
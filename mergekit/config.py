@@ -262,3 +262,7 @@ class ConfigYamlDumper(yaml.Dumper):
 
 
 ConfigYamlDumper.add_representer(list, ConfigYamlDumper.represent_list)
+
+
+# Use the libyaml-backed loader when PyYAML was built with it
+ConfigYamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
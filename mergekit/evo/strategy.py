@@ -129,10 +129,12 @@ class BufferedRayEvaluationStrategyActor:
         self.model_storage_path = model_storage_path
         self.quantization_config = quantization_config
         self._shutdown = False
+        self._wakeup = asyncio.Event()
 
     async def evaluate_genotype(self, genotype: np.ndarray):
         future_result = asyncio.Future()
         self.input_queue.append((genotype, future_result))
+        self._wakeup.set()
         return await future_result
 
     async def process_queue(self):
@@ -195,13 +197,16 @@ class BufferedRayEvaluationStrategyActor:
                     and not merged
                     and not evaluating
                 ):
-                    await asyncio.sleep(1)
+                    # idle - block until a new genotype is queued or shutdown
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
         except Exception as e:
             logging.error("Error in processing loop", exc_info=e)
             raise
 
     async def shutdown(self):
         self._shutdown = True
+        self._wakeup.set()
 
 
 class BufferedRayEvaluationStrategy(EvaluationStrategyBase):
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from mergekit.common import MergeOptions
 from mergekit.config import (
     ConditionalParameter,
+    ConfigYamlLoader,
     InputSliceDefinition,
     MergeConfiguration,
 )
@@ -48,7 +49,7 @@ def main(
 ):
     """Wrapper for using legacy bakllama configuration files."""
     with open(config_path, "r", encoding="utf-8") as file:
-        config = BakllamaConfig.model_validate(yaml.safe_load(file))
+        config = BakllamaConfig.model_validate(yaml.load(file, Loader=ConfigYamlLoader))
 
     slices = []
     for s in config.layer_slices:
@@ -24,6 +24,7 @@ except ImportError:
 
 
 from mergekit.common import ModelReference
+from mergekit.config import ConfigYamlLoader
 from mergekit.evo.config import (
     EvolMergeConfiguration,
     ModelGenomeDefinition,
@@ -148,7 +149,9 @@ def main(
     force_population_size: Optional[int],
 ):
     config = EvolMergeConfiguration.model_validate(
-        yaml.safe_load(open(genome_config_path, "r", encoding="utf-8"))
+        yaml.load(
+            open(genome_config_path, "r", encoding="utf-8"), Loader=ConfigYamlLoader
+        )
     )
 
     check_for_naughty_config(config, allow=allow_benchmark_tasks)
@@ -387,11 +387,13 @@ def plan_extraction(
     del dummy_base
 
     warned_modules = set()
+    include_patterns = [re.compile(r) for r in include_regexes or []]
+    exclude_patterns = [re.compile(r) for r in exclude_regexes or []]
 
     def _should_extract(name: str) -> bool:
-        if include_regexes and not any(re.search(r, name) for r in include_regexes):
+        if include_patterns and not any(p.search(name) for p in include_patterns):
             return False
-        if any(re.search(r, name) for r in exclude_regexes):
+        if any(p.search(name) for p in exclude_patterns):
             return False
         return True
 
@@ -420,7 +422,7 @@ def plan_extraction(
                 or module == embed_out
                 or isinstance(module, nn.Embedding)
             )
-            and not any(re.search(r, name) for r in exclude_regexes or [])
+            and not any(p.search(name) for p in exclude_patterns)
         ):
             # If embeddings are not explicitly excluded but embed_lora is False,
             # save them at full rank instead of decomposing
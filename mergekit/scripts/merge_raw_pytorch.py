@@ -13,7 +13,7 @@ from pydantic import BaseModel
 import mergekit.merge_methods as merge_methods
 from mergekit.architecture import WeightInfo
 from mergekit.common import ImmutableMap, ModelReference, dtype_from_name
-from mergekit.config import ParameterSetting, evaluate_setting
+from mergekit.config import ConfigYamlLoader, ParameterSetting, evaluate_setting
 from mergekit.graph import Executor, Task
 from mergekit.io import LazyTensorLoader, ShardedTensorIndex
 from mergekit.io.tasks import FinalizeModel, SaveTensor, TensorWriterTask
@@ -244,7 +244,9 @@ def main(
     with open(config_path, "r", encoding="utf-8") as file:
         config_source = file.read()
 
-    config = RawPyTorchMergeConfig.model_validate(yaml.safe_load(config_source))
+    config = RawPyTorchMergeConfig.model_validate(
+        yaml.load(config_source, Loader=ConfigYamlLoader)
+    )
     tasks = plan_flat_merge(
         config, out_path, tensor_union, tensor_intersection, merge_options
     )
@@ -10,6 +10,7 @@ import click
 import transformers
 import yaml
 
+from mergekit.config import ConfigYamlLoader
 from mergekit.merge import MergeOptions
 from mergekit.moe import ALL_OUTPUT_ARCHITECTURES, MoEOutputArchitecture
 from mergekit.moe.config import MoEMergeConfig, is_bad_config
@@ -178,7 +179,9 @@ def main(
     with open(config_path, "r", encoding="utf-8") as file:
         config_source = file.read()
 
-    config = MoEMergeConfig.model_validate(yaml.safe_load(config_source))
+    config = MoEMergeConfig.model_validate(
+        yaml.load(config_source, Loader=ConfigYamlLoader)
+    )
     build(
         config,
         out_path=out_path,
@@ -3,13 +3,13 @@
 
 import logging
 import os
-from typing import Dict, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
 
 import click
 import yaml
 
 from mergekit.common import ImmutableMap, ModelReference
-from mergekit.config import MergeConfiguration
+from mergekit.config import ConfigYamlLoader, MergeConfiguration
 from mergekit.graph import Executor, Task
 from mergekit.merge import run_merge
 from mergekit.options import MergeOptions, PrettyPrintHelp, add_merge_options
@@ -37,28 +37,55 @@ class MergeModelTask(Task[str]):
         return {str(key): self.input_merges[key] for key in self.input_merges}
 
     def execute(self, **kwargs):
-        if (
-            self.lazy
-            and os.path.exists(os.path.join(self.out_path, "config.json"))
-            and any(
-                os.path.exists(os.path.join(self.out_path, filename))
-                for filename in MODEL_CHECK_FILENAMES
-            )
-        ):
+        if self.lazy and self._output_up_to_date(input_paths=kwargs.values()):
             LOG.info(f"Model already exists at {self.out_path}, skipping")
             return self.out_path
 
         LOG.info(f"Running merge for {self.name}")
-        cfg = MergeConfiguration.model_validate(yaml.safe_load(self.config_yaml))
+        cfg = MergeConfiguration.model_validate(
+            yaml.load(self.config_yaml, Loader=ConfigYamlLoader)
+        )
 
         run_merge(
             cfg,
             self.out_path,
             options=self.options,
+            config_source=self.config_yaml,
         )
         LOG.info(f"Merge complete for {self.name}")
         return self.out_path
 
+    def _output_up_to_date(self, input_paths: Iterable[str]) -> bool:
+        """Check whether an existing output can be reused by a lazy run.
+
+        The output must look like a saved model, be newer than the
+        `config.json` of every input merge, and (if present) have a
+        `mergekit_config.yml` identical to this task's recipe. Copying
+        merge directories without preserving modification times (e.g.
+        `cp` without `-p`) will therefore cause downstream merges to rerun."""
+        config_path = os.path.join(self.out_path, "config.json")
+        if not os.path.exists(config_path) or not any(
+            os.path.exists(os.path.join(self.out_path, filename))
+            for filename in MODEL_CHECK_FILENAMES
+        ):
+            return False
+
+        # intermediate merges that were redone since invalidate this one
+        mtime = os.path.getmtime(config_path)
+        for input_path in input_paths:
+            if os.path.getmtime(os.path.join(input_path, "config.json")) > mtime:
+                LOG.info(f"Inputs for {self.name} changed, re-merging")
+                return False
+
+        # if the recipe was saved alongside the model, make sure it still matches
+        recipe_path = os.path.join(self.out_path, "mergekit_config.yml")
+        if os.path.exists(recipe_path):
+            with open(recipe_path, "r", encoding="utf-8") as file:
+                if file.read() != self.config_yaml:
+                    LOG.info(f"Configuration for {self.name} changed, re-merging")
+                    return False
+        return True
+
 
 @click.command("mergekit-multimerge", cls=PrettyPrintHelp)
 @click.argument("config_file", type=click.Path(exists=True))
@@ -78,7 +105,7 @@ class MergeModelTask(Task[str]):
 @click.option(
     "--lazy/--no-lazy",
     default=True,
-    help="Skip merges that already exist",
+    help="Skip merges that already exist and are up to date",
 )
 @add_merge_options
 def main(
@@ -226,7 +253,7 @@ def load_config(
         - A dictionary of merge configurations keyed by name
         - A dictionary of dependencies keyed by name
     """
-    docs = list(yaml.safe_load_all(config_source))
+    docs = list(yaml.load_all(config_source, Loader=ConfigYamlLoader))
     merge_configs = {}
     for doc in docs:
         if "name" in doc:
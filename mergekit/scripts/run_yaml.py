@@ -1,31 +1,34 @@
 # Copyright (C) 2025 Arcee AI
 # SPDX-License-Identifier: LGPL-3.0-only
 
+from typing import TextIO
 
 import click
 import yaml
 
-from mergekit.config import MergeConfiguration
+from mergekit.config import ConfigYamlLoader, MergeConfiguration
 from mergekit.merge import run_merge
 from mergekit.options import MergeOptions, PrettyPrintHelp, add_merge_options
 
 
 @click.command("mergekit-yaml", cls=PrettyPrintHelp)
-@click.argument("config_file")
+@click.argument("config_file", type=click.File("r", encoding="utf-8"))
 @click.argument("out_path")
 @add_merge_options
 def main(
     merge_options: MergeOptions,
-    config_file: str,
+    config_file: TextIO,
     out_path: str,
 ):
+    """Run a merge described by a YAML configuration file.
+
+    Pass `-` as CONFIG_FILE to read the configuration from stdin."""
     merge_options.apply_global_options()
 
-    with open(config_file, "r", encoding="utf-8") as file:
-        config_source = file.read()
+    config_source = config_file.read()
 
     merge_config: MergeConfiguration = MergeConfiguration.model_validate(
-        yaml.safe_load(config_source)
+        yaml.load(config_source, Loader=ConfigYamlLoader)
     )
     run_merge(
         merge_config,
@@ -1,6 +1,7 @@
+import huggingface_hub
 import pytest
 
-from mergekit.common import ModelPath, ModelReference
+from mergekit.common import ModelPath, ModelReference, _download_model_snapshot
 
 
 class TestModelReference:
@@ -41,3 +42,25 @@ class TestModelReference:
 
         with pytest.raises(RuntimeError):
             ModelReference.parse("a+b+c@d+e@f@g")
+
+    def test_local_path_cached(self, monkeypatch):
+        calls = []
+
+        def _list_repo_files(repo_id, repo_type=None, revision=None):
+            calls.append("list_repo_files")
+            return ["config.json", "model.safetensors"]
+
+        def _snapshot_download(repo_id, revision=None, cache_dir=None, **kwargs):
+            calls.append("snapshot_download")
+            assert "*.safetensors" in kwargs["allow_patterns"]
+            return f"/snapshots/{repo_id}@{revision}"
+
+        monkeypatch.setattr(huggingface_hub, "list_repo_files", _list_repo_files)
+        monkeypatch.setattr(huggingface_hub, "snapshot_download", _snapshot_download)
+        _download_model_snapshot.cache_clear()
+
+        mr = ModelReference.parse("hf_user/not_a_local_model@v1")
+        assert mr.local_path() == "/snapshots/hf_user/not_a_local_model@v1"
+        assert mr.local_path() == "/snapshots/hf_user/not_a_local_model@v1"
+        assert calls == ["list_repo_files", "snapshot_download"]
+        _download_model_snapshot.cache_clear()
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+import mergekit.scripts.multimerge as multimerge
+from mergekit.common import ImmutableMap
+from mergekit.options import MergeOptions
+from mergekit.scripts.multimerge import MergeModelTask
+
+CONFIG_YAML = """merge_method: linear
+models:
+- model: model_a
+  parameters:
+    weight: 0.5
+- model: model_b
+  parameters:
+    weight: 0.5"""
+
+
+def _make_output(path: str, recipe: str = CONFIG_YAML, mtime: float = 1000.0):
+    os.makedirs(path, exist_ok=True)
+    for filename in ["config.json", "model.safetensors"]:
+        with open(os.path.join(path, filename), "w", encoding="utf-8") as fp:
+            fp.write("{}")
+    with open(os.path.join(path, "mergekit_config.yml"), "w", encoding="utf-8") as fp:
+        fp.write(recipe)
+    os.utime(os.path.join(path, "config.json"), (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def merge_calls(monkeypatch):
+    calls = []
+
+    def _run_merge(config, out_path, options, config_source=None):
+        calls.append((out_path, config_source))
+
+    monkeypatch.setattr(multimerge, "run_merge", _run_merge)
+    return calls
+
+
+def _task(out_path: str) -> MergeModelTask:
+    return MergeModelTask(
+        config_yaml=CONFIG_YAML,
+        name="test",
+        input_merges=ImmutableMap({}),
+        options=MergeOptions(),
+        out_path=out_path,
+        lazy=True,
+    )
+
+
+class TestLazyMultimerge:
+    def test_up_to_date_skips(self, tmp_path, merge_calls):
+        out_path = _make_output(str(tmp_path / "out"))
+        input_path = _make_output(str(tmp_path / "input"), mtime=500.0)
+
+        assert _task(out_path).execute(input=input_path) == out_path
+        assert merge_calls == []
+
+    def test_changed_recipe_remerges(self, tmp_path, merge_calls):
+        out_path = _make_output(
+            str(tmp_path / "out"), recipe=CONFIG_YAML.replace("0.5", "0.3")
+        )
+
+        _task(out_path).execute()
+        assert merge_calls == [(out_path, CONFIG_YAML)]
+
+    def test_newer_input_remerges(self, tmp_path, merge_calls):
+        out_path = _make_output(str(tmp_path / "out"))
+        input_path = _make_output(str(tmp_path / "input"), mtime=2000.0)
+
+        _task(out_path).execute(input=input_path)
+        assert merge_calls == [(out_path, CONFIG_YAML)]
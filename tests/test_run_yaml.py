@@ -0,0 +1,37 @@
+from click.testing import CliRunner
+
+import mergekit.scripts.run_yaml as run_yaml
+from mergekit.config import MergeConfiguration
+
+CONFIG_YAML = """merge_method: linear
+models:
+  - model: model_a
+    parameters:
+      weight: 0.25
+  - model: model_b
+    parameters:
+      weight: 0.75
+"""
+
+
+class TestRunYaml:
+    def test_config_from_stdin(self, tmp_path, monkeypatch):
+        calls = []
+
+        def _run_merge(config, out_path, options, config_source=None):
+            calls.append((config, out_path, config_source))
+
+        monkeypatch.setattr(run_yaml, "run_merge", _run_merge)
+
+        out_path = str(tmp_path / "out")
+        result = CliRunner().invoke(run_yaml.main, ["-", out_path], input=CONFIG_YAML)
+        assert result.exit_code == 0, result.output
+
+        assert len(calls) == 1
+        config, called_out_path, config_source = calls[0]
+        assert isinstance(config, MergeConfiguration)
+        assert config.merge_method == "linear"
+        assert [str(m.model) for m in config.models] == ["model_a", "model_b"]
+        assert [m.parameters["weight"] for m in config.models] == [0.25, 0.75]
+        assert called_out_path == out_path
+        assert config_source == CONFIG_YAML